@@ -13,119 +13,25 @@ from testproject.constants import (
 )
 from testproject.forms import BleachForm, CustomBleachWidget
 
+# BleachField only reads the sanitizer when cleaning, so one instance can be
+# shared. Go back to per-field instances if that ever stops being true.
+_SHARED_CSS_SANITIZER = CSSSanitizer(
+    allowed_css_properties=ALLOWED_CSS_PROPERTIES
+)
 
-class TestBleachField(TestCase):
-    def test_empty(self):
-        """
-        Test that the empty_value arg is returned for any input empty value
-        """
-        for requested_empty_value in ("", None):
-            field = BleachField(empty_value=requested_empty_value)
-            for empty_value in field.empty_values:
-                self.assertEqual(
-                    field.to_python(empty_value), requested_empty_value
-                )
-
-    def test_return_type(self):
-        """Test bleached values are SafeString objects"""
-        field = BleachField()
-        self.assertIsInstance(field.to_python("some text"), SafeString)
-
-    def test_bleaching(self):
-        """Test values are bleached"""
-        test_data = {
-            "no_tags": "<h1>Heading</h1>",
-            "no_strip": "<h1>Heading</h1>",
-            "bleach_strip": "<!-- script here -->"
-            '<script>alert("Hello World")</script>',
-            "bleach_attrs": '<a href="https://www.google.com" '
-            'target="_blank">google.com</a>',
-            "bleach_css_sanitizer": '<li style="color: white">item</li>',
-        }
-        form = BleachForm(data=test_data)
-        form.is_valid()
-        self.assertEqual(form.cleaned_data["no_tags"], "Heading")
-        self.assertEqual(
-            form.cleaned_data["no_strip"], "&lt;h1&gt;Heading&lt;/h1&gt;"
-        )
-        self.assertEqual(
-            form.cleaned_data["bleach_strip"], 'alert("Hello World")'
-        )
-        self.assertEqual(
-            form.cleaned_data["bleach_attrs"],
-            '<a href="https://www.google.com">google.com</a>',
-        )
-        self.assertNotEqual(
-            form.cleaned_data["bleach_css_sanitizer"],
-            test_data["bleach_css_sanitizer"],
-        )
-
-    def test_tags(self):
-        """Test allowed tags are rendered"""
-        test_data = {
-            "no_tags": "<p>No tags here</p>",
-            "no_strip": "No tags here",
-            "bleach_strip": "<ul><li>one</li><li>two</li></ul>",
-            "bleach_attrs": '<a href="https://www.google.com" '
-            'title="Google">google.com</a>',
-            "bleach_css_sanitizer": '<li style="color: white;">item</li>',
-        }
-        form = BleachForm(data=test_data)
-        form.is_valid()
-        self.assertEqual(form.cleaned_data["no_tags"], "No tags here")
-        self.assertEqual(form.cleaned_data["no_strip"], "No tags here")
-
-        self.assertEqual(
-            form.cleaned_data["bleach_strip"], test_data["bleach_strip"]
-        )
-        self.assertEqual(
-            form.cleaned_data["bleach_attrs"], test_data["bleach_attrs"]
-        )
-        self.assertEqual(
-            form.cleaned_data["bleach_css_sanitizer"],
-            test_data["bleach_css_sanitizer"],
-        )
 
-    def test_attrs(self):
-        """Test allowed attributes are rendered"""
-        list_html = (
-            '<ul class="our-list">'
-            '<li class="list-item">one</li>'
-            "<li>two</li>"
-            "</ul>"
-        )
-        test_data = {
-            "no_strip": "",
-            "no_tags": list_html,
-            "bleach_strip": list_html,
-            "bleach_attrs": list_html,
-            "bleach_css_sanitizer": list_html,
-        }
-        form = BleachForm(data=test_data)
-        form.is_valid()
-        self.assertEqual(form.cleaned_data["no_tags"], "\none\ntwo")
-
-        self.assertEqual(
-            form.cleaned_data["bleach_strip"],
-            "<ul><li>one</li><li>two</li></ul>",
-        )
-        self.assertEqual(
-            form.cleaned_data["bleach_attrs"], test_data["bleach_strip"]
-        )
-        self.assertEqual(
-            form.cleaned_data["bleach_css_sanitizer"],
-            "<ul><li>one</li><li>two</li></ul>",
-        )
+def _custom_form():
+    """
+    Return a ``BleachForm`` equivalent built with ``CustomBleachWidget``.
 
+    The override has to be active while the fields are constructed, since
+    that is when ``get_default_widget()`` reads the setting.
+    """
+    with override_settings(
+        BLEACH_DEFAULT_WIDGET="testproject.forms.CustomBleachWidget"
+    ):
 
-@override_settings(
-    BLEACH_DEFAULT_WIDGET="testproject.forms.CustomBleachWidget"
-)
-class TestCustomWidget(TestCase):
-    def setUp(self):
         class CustomForm(forms.Form):
-            # Define form inside function with overridden settings so
-            # get_default_widget() sees the modified setting.
             no_tags = BleachField(
                 max_length=100, strip_tags=True, allowed_tags=[]
             )
@@ -157,12 +63,157 @@ class TestCustomWidget(TestCase):
                 strip_tags=False,
                 allowed_attributes=["style"],
                 allowed_tags=ALLOWED_TAGS,
-                css_sanitizer=CSSSanitizer(
-                    allowed_css_properties=ALLOWED_CSS_PROPERTIES
-                ),
+                css_sanitizer=_SHARED_CSS_SANITIZER,
             )
 
-        self.CustomForm = CustomForm
+    return CustomForm
+
+
+_H1_HEADING = "<h1>Heading</h1>"
+_HEADING = "Heading"
+_H1_HEADING_ESCAPED = "&lt;h1&gt;Heading&lt;/h1&gt;"
+_ALERT_OUT = 'alert("Hello World")'
+_BLEACH_STRIP_IN = '<!-- script here --><script>alert("Hello World")</script>'
+_GOOGLE_ANCHOR = '<a href="https://www.google.com">google.com</a>'
+_LIST_HTML = (
+    '<ul class="our-list"><li class="list-item">one</li><li>two</li></ul>'
+)
+
+_TEST_DATA_BLEACHING = {
+    "no_tags": _H1_HEADING,
+    "no_strip": _H1_HEADING,
+    "bleach_strip": _BLEACH_STRIP_IN,
+    "bleach_attrs": '<a href="https://www.google.com" '
+    'target="_blank">google.com</a>',
+    "bleach_css_sanitizer": '<li style="color: white">item</li>',
+}
+
+_TEST_DATA_TAGS = {
+    "no_tags": "<p>No tags here</p>",
+    "no_strip": "No tags here",
+    "bleach_strip": "<ul><li>one</li><li>two</li></ul>",
+    "bleach_attrs": '<a href="https://www.google.com" '
+    'title="Google">google.com</a>',
+    "bleach_css_sanitizer": '<li style="color: white;">item</li>',
+}
+
+_TEST_DATA_ATTRS = {
+    "no_strip": "",
+    **dict.fromkeys(
+        ("no_tags", "bleach_strip", "bleach_attrs", "bleach_css_sanitizer"),
+        _LIST_HTML,
+    ),
+}
+
+_TEST_DATA_CUSTOM_WIDGET = {
+    "no_tags": _H1_HEADING,
+    "no_strip": _H1_HEADING,
+    "bleach_strip": _BLEACH_STRIP_IN,
+    "bleach_attrs": (
+        '<a href="http://www.google.com" target="_blank">google.com</a>'
+        + _GOOGLE_ANCHOR
+    ),
+    "bleach_styles": '<li style="color: white">item</li>',
+    "bleach_css_sanitizer": '<li style="color: white">item</li>',
+}
+
+# Marks a row whose cleaned value must differ from its input.
+_NEQ = object()
+
+_EXPECTED_BLEACHING = (
+    ("no_tags", _HEADING),
+    ("no_strip", _H1_HEADING_ESCAPED),
+    ("bleach_strip", _ALERT_OUT),
+    ("bleach_attrs", _GOOGLE_ANCHOR),
+    ("bleach_css_sanitizer", _NEQ),
+)
+
+_EXPECTED_TAGS = (
+    ("no_tags", "No tags here"),
+    ("no_strip", "No tags here"),
+    ("bleach_strip", _TEST_DATA_TAGS["bleach_strip"]),
+    ("bleach_attrs", _TEST_DATA_TAGS["bleach_attrs"]),
+    ("bleach_css_sanitizer", _TEST_DATA_TAGS["bleach_css_sanitizer"]),
+)
+
+_EXPECTED_ATTRS = (
+    ("no_tags", "\none\ntwo"),
+    ("bleach_strip", "<ul><li>one</li><li>two</li></ul>"),
+    ("bleach_attrs", _LIST_HTML),
+    ("bleach_css_sanitizer", "<ul><li>one</li><li>two</li></ul>"),
+)
+
+_EXPECTED_CUSTOM_WIDGET = (
+    ("no_tags", _HEADING),
+    ("no_strip", _H1_HEADING_ESCAPED),
+    ("bleach_strip", _ALERT_OUT),
+    ("bleach_attrs", f"<a>google.com</a>{_GOOGLE_ANCHOR}"),
+    ("bleach_styles", _NEQ),
+    ("bleach_css_sanitizer", _NEQ),
+)
+
+
+class BleachAssertionsMixin:
+    def _assert_bleach(self, form, table, src):
+        """
+        Check ``form.cleaned_data`` against ``(field, expected)`` rows.
+
+        Equality rows are compared in a single dict assertion. Rows marked
+        ``_NEQ`` only assert the value was changed from ``src``.
+        """
+        cd = form.cleaned_data
+        expected = {name: exp for name, exp in table if exp is not _NEQ}
+        self.assertDictEqual({name: cd[name] for name in expected}, expected)
+        for name, exp in table:
+            if exp is _NEQ:
+                with self.subTest(field=name):
+                    self.assertNotEqual(cd[name], src[name])
+
+
+class TestBleachField(BleachAssertionsMixin, TestCase):
+    def _run(self, data):
+        """Bind ``data`` to a fresh form, clean it and return the form"""
+        form = BleachForm(data=data)
+        form.full_clean()
+        return form
+
+    def test_empty(self):
+        """
+        Test that the empty_value arg is returned for any input empty value
+        """
+        for requested_empty_value in ("", None):
+            field = BleachField(empty_value=requested_empty_value)
+            empty_values = list(field.empty_values)
+            self.assertEqual(
+                [field.to_python(value) for value in empty_values],
+                [requested_empty_value] * len(empty_values),
+            )
+
+    def test_return_type(self):
+        """Test bleached values are SafeString objects"""
+        field = BleachField()
+        self.assertIsInstance(field.to_python("some text"), SafeString)
+
+    def test_bleaching(self):
+        """Test values are bleached"""
+        form = self._run(_TEST_DATA_BLEACHING)
+        self._assert_bleach(form, _EXPECTED_BLEACHING, _TEST_DATA_BLEACHING)
+
+    def test_tags(self):
+        """Test allowed tags are rendered"""
+        form = self._run(_TEST_DATA_TAGS)
+        self._assert_bleach(form, _EXPECTED_TAGS, _TEST_DATA_TAGS)
+
+    def test_attrs(self):
+        """Test allowed attributes are rendered"""
+        form = self._run(_TEST_DATA_ATTRS)
+        self._assert_bleach(form, _EXPECTED_ATTRS, _TEST_DATA_ATTRS)
+
+
+class TestCustomWidget(BleachAssertionsMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.CustomForm = _custom_form()
 
     def test_custom_widget_type(self):
         """Test widget class matches BLEACH_DEFAULT_WIDGET"""
@@ -174,36 +225,8 @@ class TestCustomWidget(TestCase):
         Test input is bleached according to config while using a custom
         widget
         """
-        test_data = {
-            "no_tags": "<h1>Heading</h1>",
-            "no_strip": "<h1>Heading</h1>",
-            "bleach_strip": "<!-- script here -->"
-            '<script>alert("Hello World")</script>',
-            "bleach_attrs": (
-                '<a href="http://www.google.com" '
-                'target="_blank">google.com</a>'
-                '<a href="https://www.google.com">google.com</a>'
-            ),
-            "bleach_styles": '<li style="color: white">item</li>',
-            "bleach_css_sanitizer": '<li style="color: white">item</li>',
-        }
-        form = self.CustomForm(data=test_data)
-        form.is_valid()
-        self.assertEqual(form.cleaned_data["no_tags"], "Heading")
-        self.assertEqual(
-            form.cleaned_data["no_strip"], "&lt;h1&gt;Heading&lt;/h1&gt;"
-        )
-        self.assertEqual(
-            form.cleaned_data["bleach_strip"], 'alert("Hello World")'
-        )
-        self.assertEqual(
-            form.cleaned_data["bleach_attrs"],
-            '<a>google.com</a><a href="https://www.google.com">google.com</a>',
-        )
-        self.assertNotEqual(
-            form.cleaned_data["bleach_styles"], test_data["bleach_styles"]
-        )
-        self.assertNotEqual(
-            form.cleaned_data["bleach_css_sanitizer"],
-            test_data["bleach_css_sanitizer"],
+        form = self.CustomForm(data=_TEST_DATA_CUSTOM_WIDGET)
+        form.full_clean()
+        self._assert_bleach(
+            form, _EXPECTED_CUSTOM_WIDGET, _TEST_DATA_CUSTOM_WIDGET
         )